@@ -2,14 +2,21 @@
 """Fetch Anthropic API cost report for a specified time period."""
 
 import argparse
+import functools
+import gzip
 import json
+import math
 import os
+import re
 import sys
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta, timezone
 from urllib.request import Request, urlopen
 from urllib.error import HTTPError, URLError
 
+ADMIN_KEY_RE = re.compile(r"^[ \t]*ANTHROPIC_ADMIN_KEY=([^\r\n]*)", re.M)
 
+
+@functools.lru_cache(maxsize=1)
 def load_api_key():
     """Load the admin API key from ~/.env file."""
     env_path = os.path.expanduser("~/.env")
@@ -18,21 +25,28 @@ def load_api_key():
         sys.exit(1)
 
     with open(env_path) as f:
-        for line in f:
-            line = line.strip()
-            if line.startswith("ANTHROPIC_ADMIN_KEY="):
-                return line.split("=", 1)[1].strip().strip('"').strip("'")
+        match = ADMIN_KEY_RE.search(f.read())
+    if match:
+        return match.group(1).strip().strip('"').strip("'")
 
     print("Error: ANTHROPIC_ADMIN_KEY not found in ~/.env", file=sys.stderr)
     sys.exit(1)
 
 
-def fetch_cost_report(start_dt: datetime, end_dt: datetime, api_key: str) -> dict:
+# No group_by: the API then returns a single aggregated result per bucket.
+# limit=31 is the per-page maximum, so a month fits in one request.
+COST_REPORT_URL = (
+    "https://api.anthropic.com/v1/organizations/cost_report"
+    "?starting_at={}&ending_at={}&limit=31"
+)
+
+
+def fetch_cost_report(start: date, end: date, api_key: str) -> dict:
     """Fetch cost report from Anthropic API, following pagination."""
-    start_str = start_dt.strftime("%Y-%m-%dT00:00:00Z")
-    end_str = end_dt.strftime("%Y-%m-%dT00:00:00Z")
+    start_str = f"{start.isoformat()}T00:00:00Z"
+    end_str = f"{end.isoformat()}T00:00:00Z"
 
-    base_url = f"https://api.anthropic.com/v1/organizations/cost_report?starting_at={start_str}&ending_at={end_str}"
+    base_url = COST_REPORT_URL.format(start_str, end_str)
     all_data = []
     url = base_url
 
@@ -40,12 +54,19 @@ def fetch_cost_report(start_dt: datetime, end_dt: datetime, api_key: str) -> dic
         req = Request(url)
         req.add_header("anthropic-version", "2023-06-01")
         req.add_header("x-api-key", api_key)
+        req.add_header("Accept-Encoding", "gzip")
 
         try:
             with urlopen(req) as response:
-                page = json.loads(response.read().decode())
+                if response.headers.get("Content-Encoding") == "gzip":
+                    page = json.load(gzip.GzipFile(fileobj=response))
+                else:
+                    page = json.load(response)
         except HTTPError as e:
-            error_body = e.read().decode()
+            error_body = e.read()
+            if e.headers.get("Content-Encoding") == "gzip":
+                error_body = gzip.decompress(error_body)
+            error_body = error_body.decode()
             print(f"API Error ({e.code}): {error_body}", file=sys.stderr)
             sys.exit(1)
         except URLError as e:
@@ -66,29 +87,31 @@ MONTHS = {
     "may": 5, "june": 6, "july": 7, "august": 8,
     "september": 9, "october": 10, "november": 11, "december": 12,
     "jan": 1, "feb": 2, "mar": 3, "apr": 4, "jun": 6,
-    "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12
+    "jul": 7, "aug": 8, "sep": 9, "sept": 9, "oct": 10, "nov": 11, "dec": 12
 }
 
 
-def parse_period(period: str) -> tuple[datetime, datetime, datetime, datetime]:
+def parse_period(period: str) -> tuple[date, date, date, date, bool]:
     """
     Parse a time period string into dates.
 
-    Returns (api_start, api_end, filter_start, filter_end).
+    Returns (api_start, api_end, filter_start, filter_end, needs_filter).
     - api_start/api_end: dates to send to API (padded to meet 2-day minimum)
     - filter_start/filter_end: actual requested dates for filtering results
+    - needs_filter: True if the API range was padded beyond the filter range
     """
     period = period.lower().strip()
-    today = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+    today = datetime.now(timezone.utc).date()
 
     def make_result(start, end):
-        """Return API dates (padded if needed) and filter dates."""
+        """Return API dates (padded if needed), filter dates and whether padding applied."""
         filter_start, filter_end = start, end
         api_start, api_end = start, end
         # API requires minimum 2-day span
-        if (api_end - api_start).days < 2:
+        needs_filter = (api_end - api_start).days < 2
+        if needs_filter:
             api_end = api_start + timedelta(days=2)
-        return api_start, api_end, filter_start, filter_end
+        return api_start, api_end, filter_start, filter_end, needs_filter
 
     if period in ("last week", "past week"):
         start = today - timedelta(days=6)
@@ -140,39 +163,39 @@ def parse_period(period: str) -> tuple[datetime, datetime, datetime, datetime]:
     if " to " in period:
         parts = period.split(" to ")
         try:
-            start = datetime.strptime(parts[0].strip(), "%Y-%m-%d")
-            end = datetime.strptime(parts[1].strip(), "%Y-%m-%d") + timedelta(days=1)
+            start = datetime.strptime(parts[0].strip(), "%Y-%m-%d").date()
+            end = datetime.strptime(parts[1].strip(), "%Y-%m-%d").date() + timedelta(days=1)
             return make_result(start, end)
         except ValueError:
             pass
 
     # Single date: "YYYY-MM-DD"
     try:
-        date = datetime.strptime(period, "%Y-%m-%d")
-        start = date
-        end = date + timedelta(days=1)
+        day = datetime.strptime(period, "%Y-%m-%d").date()
+        start = day
+        end = day + timedelta(days=1)
         return make_result(start, end)
     except ValueError:
         pass
 
     # Month name with optional year
-    for month_name, month_num in MONTHS.items():
-        if period.startswith(month_name):
-            parts = period.split()
-            if len(parts) == 2:
-                try:
-                    year = int(parts[1])
-                except ValueError:
-                    year = today.year
-            else:
-                year = today.year
-
-            start = datetime(year, month_num, 1)
-            if month_num == 12:
-                end = datetime(year + 1, 1, 1)
-            else:
-                end = datetime(year, month_num + 1, 1)
-            return make_result(start, end)
+    tokens = period.split(None, 1)
+    month_num = MONTHS.get(tokens[0].rstrip(".,")) if tokens else None
+    if not month_num:
+        # Fall back to prefix matching for inputs like "jan2025"
+        month_num = next((num for name, num in MONTHS.items() if period.startswith(name)), None)
+    if month_num:
+        try:
+            year = int(tokens[1]) if len(tokens) == 2 else today.year
+        except ValueError:
+            year = today.year
+
+        start = date(year, month_num, 1)
+        if month_num == 12:
+            end = date(year + 1, 1, 1)
+        else:
+            end = date(year, month_num + 1, 1)
+        return make_result(start, end)
 
     print(f"Error: Could not parse period '{period}'", file=sys.stderr)
     print("Supported formats: 'last week', 'last month', 'this month', 'yesterday',", file=sys.stderr)
@@ -181,15 +204,15 @@ def parse_period(period: str) -> tuple[datetime, datetime, datetime, datetime]:
     sys.exit(1)
 
 
-def filter_buckets(data: dict, filter_start: datetime, filter_end: datetime) -> list:
+def filter_buckets(data: dict, filter_start: date, filter_end: date) -> list:
     """Filter buckets to only include those within the requested range."""
-    buckets = data.get("data", [])
-    filtered = []
-    for bucket in buckets:
-        bucket_start = datetime.strptime(bucket["starting_at"][:10], "%Y-%m-%d")
-        if bucket_start >= filter_start and bucket_start < filter_end:
-            filtered.append(bucket)
-    return filtered
+    # ISO dates sort lexicographically, so compare strings instead of parsing each bucket
+    start_str = filter_start.isoformat()
+    end_str = filter_end.isoformat()
+    return [
+        bucket for bucket in data.get("data", [])
+        if start_str <= bucket["starting_at"][:10] < end_str
+    ]
 
 
 def format_output(buckets: list, output_format: str, raw_data: dict = None):
@@ -202,20 +225,18 @@ def format_output(buckets: list, output_format: str, raw_data: dict = None):
         print("No cost data found for the specified period.")
         return
 
-    total_cents = 0.0
-
-    print(f"{'Date':<12} {'Cost':>12}")
-    print("-" * 25)
-
-    for bucket in buckets:
-        date = bucket["starting_at"][:10]
-        amount_cents = sum(float(r["amount"]) for r in bucket.get("results", []))
-        amount_dollars = amount_cents / 100
-        total_cents += amount_cents
-        print(f"{date:<12} ${amount_dollars:>10.2f}")
+    # Amounts are decimal cent strings; fsum avoids accumulating rounding error in the sums
+    rows = [
+        (b["starting_at"][:10], math.fsum(float(r["amount"]) for r in b.get("results", ())))
+        for b in buckets
+    ]
+    total_cents = math.fsum(cents for _, cents in rows)
 
-    print("-" * 25)
-    print(f"{'Total':<12} ${total_cents / 100:>10.2f}")
+    lines = [f"{'Date':<12} {'Cost':>12}", "-" * 25]
+    lines.extend(f"{day:<12} ${cents / 100:>10.2f}" for day, cents in rows)
+    lines.append("-" * 25)
+    lines.append(f"{'Total':<12} ${total_cents / 100:>10.2f}")
+    print("\n".join(lines))
 
 
 def main():
@@ -227,10 +248,13 @@ def main():
     args = parser.parse_args()
 
     api_key = load_api_key()
-    api_start, api_end, filter_start, filter_end = parse_period(args.period)
+    api_start, api_end, filter_start, filter_end, needs_filter = parse_period(args.period)
 
     data = fetch_cost_report(api_start, api_end, api_key)
-    filtered_buckets = filter_buckets(data, filter_start, filter_end)
+    if needs_filter:
+        filtered_buckets = filter_buckets(data, filter_start, filter_end)
+    else:
+        filtered_buckets = data.get("data", [])
 
     format_output(filtered_buckets, args.format, data if args.format == "json" else None)
 